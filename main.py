@@ -4,8 +4,11 @@ Orchestrates all modules to run complete analysis workflow.
 """
 
 import sys
+import io
+import contextlib
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
@@ -17,6 +20,61 @@ from src.analyzer import Analyzer
 from src.visualizer import Visualizer
 
 
+def run_analysis_step(df, output_dir):
+    """
+    Run and export the full analysis in a worker process.
+    
+    Args:
+        df (pd.DataFrame): Dataset with engineered features
+        output_dir (str): Directory to save analysis results
+    
+    Returns:
+        tuple: (analysis results, captured console output)
+    
+    Raises:
+        Exception: Re-raised from the step after its captured output is
+            written to stderr
+    """
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            analyzer = Analyzer(df)
+            analysis_results = analyzer.run_full_analysis()
+            analyzer.export_results(output_dir)
+    except Exception:
+        # Keep what the step printed so the failure can be diagnosed
+        sys.stderr.write(log.getvalue())
+        raise
+    return analysis_results, log.getvalue()
+
+
+def run_visualization_step(df, output_dir):
+    """
+    Create all visualizations in a worker process.
+    
+    Args:
+        df (pd.DataFrame): Dataset with engineered features
+        output_dir (str): Directory to save plots
+    
+    Returns:
+        tuple: (saved plot paths, captured console output)
+    
+    Raises:
+        Exception: Re-raised from the step after its captured output is
+            written to stderr
+    """
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            visualizer = Visualizer(df, output_dir=output_dir)
+            figures = visualizer.create_all_visualizations()
+    except Exception:
+        # Keep what the step printed so the failure can be diagnosed
+        sys.stderr.write(log.getvalue())
+        raise
+    return figures, log.getvalue()
+
+
 class NetflixAnalysisPipeline:
     """
     Complete analysis pipeline for Netflix dataset.
@@ -79,21 +137,30 @@ class NetflixAnalysisPipeline:
             engineer.export_engineered_data("data/processed/netflix_engineered.csv")
             self.results['engineered_data'] = df_engineered
             
+            # Steps 4 and 5 only read df_engineered, so they run in parallel
+            # worker processes; each step's output is printed once it finishes
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                analysis_future = executor.submit(
+                    run_analysis_step, df_engineered, "data/processed/analysis_results"
+                )
+                visualization_future = executor.submit(
+                    run_visualization_step, df_engineered, "visualizations"
+                )
+                analysis_results, analysis_log = analysis_future.result()
+                figures, visualization_log = visualization_future.result()
+            
             # Step 4: Analyze Data
             print("\n" + "─"*70)
             print("STEP 4: ANALYZING DATA")
             print("─"*70)
-            analyzer = Analyzer(df_engineered)
-            analysis_results = analyzer.run_full_analysis()
-            analyzer.export_results("data/processed/analysis_results")
+            print(analysis_log, end="")
             self.results['analysis'] = analysis_results
             
             # Step 5: Create Visualizations
             print("\n" + "─"*70)
             print("STEP 5: CREATING VISUALIZATIONS")
             print("─"*70)
-            visualizer = Visualizer(df_engineered, output_dir="visualizations")
-            figures = visualizer.create_all_visualizations()
+            print(visualization_log, end="")
             self.results['visualizations'] = figures
             
             # Step 6: Generate Summary Report
@@ -135,9 +202,15 @@ class NetflixAnalysisPipeline:
         
         # Calculate key metrics
         total_titles = len(df)
-        total_movies = df['is_movie'].sum()
-        total_tv_shows = df['is_tv_show'].sum()
-        avg_movie_duration = df[df['is_movie'] == 1]['duration_minutes'].mean()
+        total_movies = int(df['is_movie'].sum())
+        total_tv_shows = int(df['is_tv_show'].sum())
+        total_multi_country = int(df['is_multi_country'].sum())
+        total_adult = int(df['is_adult_content'].sum())
+        movie_pct = total_movies / total_titles * 100
+        tv_show_pct = total_tv_shows / total_titles * 100
+        multi_country_pct = total_multi_country / total_titles * 100
+        adult_pct = total_adult / total_titles * 100
+        avg_movie_duration = df.loc[df['is_movie'] == 1, 'duration_minutes'].mean()
         avg_content_age = df['content_age'].mean()
         
         top_genre = df['primary_genre'].value_counts().index[0]
@@ -160,16 +233,16 @@ This report presents a comprehensive analysis of Netflix's content catalog, cove
 
 ### Overall Statistics
 - **Total Titles:** {total_titles:,}
-- **Movies:** {total_movies:,} ({total_movies/total_titles*100:.1f}%)
-- **TV Shows:** {total_tv_shows:,} ({total_tv_shows/total_titles*100:.1f}%)
+- **Movies:** {total_movies:,} ({movie_pct:.1f}%)
+- **TV Shows:** {total_tv_shows:,} ({tv_show_pct:.1f}%)
 - **Average Movie Duration:** {avg_movie_duration:.1f} minutes
 - **Average Content Age:** {avg_content_age:.1f} years
 
 ### Content Insights
 - **Top Genre:** {top_genre}
 - **Top Producing Country:** {top_country}
-- **Multi-Country Productions:** {df['is_multi_country'].sum():,} ({df['is_multi_country'].sum()/total_titles*100:.1f}%)
-- **Adult Content (TV-MA/R/NC-17):** {df['is_adult_content'].sum():,} ({df['is_adult_content'].sum()/total_titles*100:.1f}%)
+- **Multi-Country Productions:** {total_multi_country:,} ({multi_country_pct:.1f}%)
+- **Adult Content (TV-MA/R/NC-17):** {total_adult:,} ({adult_pct:.1f}%)
 
 ---
 
@@ -250,8 +323,7 @@ netflix-content-analysis/
 """
         
         # Write report to file
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report)
+        report_path.write_text(report, encoding='utf-8')
         
         print(f"Summary report generated: {report_path}")
     
@@ -260,45 +332,50 @@ netflix-content-analysis/
         Print key insights to console for quick reference.
         """
         df = self.results['engineered_data']
+        analysis = self.results['analysis']
+        summary = analysis['statistical_summary'].set_index('Metric')['Value']
+        total_titles = summary['Total Titles']
         
         print("\n" + "="*70)
         print("KEY INSIGHTS")
         print("="*70)
         
         # Insight 1: Content Growth
-        yearly_counts = df.groupby('year_added').size()
+        yearly_counts = analysis['time_series_analysis']['yearly_additions']['Total Titles']
         recent_growth = ((yearly_counts.iloc[-1] - yearly_counts.iloc[-5]) / yearly_counts.iloc[-5] * 100)
         print(f"\nContent Growth:")
         print(f"   • 5-year growth rate: {recent_growth:.1f}%")
         
         # Insight 2: Movie vs TV Show ratio
-        movie_pct = (df['is_movie'].sum() / len(df) * 100)
+        movie_pct = (summary['Total Movies'] / total_titles * 100)
         print(f"\nContent Mix:")
         print(f"   • Movies: {movie_pct:.1f}%")
         print(f"   • TV Shows: {100-movie_pct:.1f}%")
         
-        # Insight 3: Duration insights
-        avg_duration = df[df['is_movie'] == 1]['duration_minutes'].mean()
-        median_duration = df[df['is_movie'] == 1]['duration_minutes'].median()
+        # Insight 3: Duration insights (median is not part of the analysis results)
+        movie_durations = df.loc[df['is_movie'] == 1, 'duration_minutes']
+        avg_duration = movie_durations.mean()
+        median_duration = movie_durations.median()
         print(f"\nMovie Duration:")
         print(f"   • Average: {avg_duration:.1f} minutes")
         print(f"   • Median: {median_duration:.1f} minutes")
         
         # Insight 4: Top genres
-        top_3_genres = df['primary_genre'].value_counts().head(3)
+        top_3_genres = analysis['genre_country_analysis']['top_genres'].head(3)
         print(f"\nTop 3 Genres:")
-        for genre, count in top_3_genres.items():
-            pct = (count / len(df) * 100)
+        for genre, count in zip(top_3_genres['Genre'], top_3_genres['Count']):
+            pct = (count / total_titles * 100)
             print(f"   • {genre}: {count:,} titles ({pct:.1f}%)")
         
         # Insight 5: International content
-        multi_country_pct = (df['is_multi_country'].sum() / len(df) * 100)
+        multi_country_pct = (summary['Multi-Country Productions'] / total_titles * 100)
         print(f"\nInternational Collaboration:")
         print(f"   • Multi-country productions: {multi_country_pct:.1f}%")
         
         # Insight 6: Content freshness
-        new_content = df[df['content_age_category'] == 'New'].shape[0]
-        new_pct = (new_content / len(df) * 100)
+        age_dist = analysis['content_type_analysis']['content_age_distribution']
+        new_content = age_dist.loc[age_dist['Age Category'] == 'New', 'Count'].sum()
+        new_pct = (new_content / total_titles * 100)
         print(f"\nContent Freshness:")
         print(f"   • New content (0-2 years): {new_content:,} titles ({new_pct:.1f}%)")
         
@@ -6,6 +6,29 @@ Performs statistical analysis and generates insights.
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from feature_engineer import MONTH_NAMES
+
+
+# Columns referenced by the analysis methods; everything else is dropped on init
+ANALYSIS_COLUMNS = [
+    'show_id', 'type', 'rating',
+    'is_movie', 'is_tv_show', 'is_adult_content', 'is_multi_country',
+    'duration_minutes', 'duration_seasons', 'content_age', 'genre_count',
+    'content_age_category', 'duration_category', 'release_era',
+    'primary_genre', 'primary_country',
+    'year_added', 'month_name', 'quarter_added'
+]
+
+# Low-cardinality string columns stored as categoricals for faster grouping
+CATEGORICAL_COLUMNS = [
+    'type', 'rating', 'primary_genre', 'primary_country',
+    'content_age_category', 'duration_category', 'release_era'
+]
+
+# 0/1 flag columns, only ever summed or used as masks
+FLAG_COLUMNS = ['is_movie', 'is_tv_show', 'is_adult_content', 'is_multi_country']
 
 
 class Analyzer:
@@ -15,17 +38,117 @@ class Analyzer:
     Attributes:
         df (pd.DataFrame): Dataset with engineered features
         results (dict): Dictionary storing all analysis results
+        verbose (bool): Whether result tables are printed
     """
     
-    def __init__(self, df):
+    def __init__(self, df, verbose=True):
         """
         Initialize Analyzer with engineered dataset.
         
+        Only the columns in ANALYSIS_COLUMNS are kept, with low-cardinality
+        string columns converted to categoricals and flag columns packed to
+        uint8. The caller's DataFrame is never mutated.
+        
         Args:
             df (pd.DataFrame): Dataset with engineered features
+            verbose (bool): Print result tables as they are computed
         """
-        self.df = df.copy()
+        self.verbose = verbose
+        dtypes = {col: 'category' for col in CATEGORICAL_COLUMNS}
+        dtypes.update({col: np.uint8 for col in FLAG_COLUMNS})
+        dtypes['month_name'] = pd.CategoricalDtype(MONTH_NAMES, ordered=True)
+        self.df = df[ANALYSIS_COLUMNS].astype(dtypes)
         self.results = {}
+        
+        # Cache aggregates shared across analysis methods
+        self._total_titles = len(self.df)
+        self._flag_totals = self.df[FLAG_COLUMNS].sum().astype(np.int64)
+        self._total_movies = self._flag_totals['is_movie']
+        self._top_genres = self._top_n('primary_genre', 10)
+        self._top_countries = self._top_n('primary_country', 10)
+        
+        # Movie rows are filtered once and reused by the movie-only analyses
+        self._movie_mask = self.df['is_movie'].to_numpy().view(bool)
+        self._movies_df = self.df.loc[self._movie_mask, ['duration_minutes', 'duration_category', 'primary_genre']]
+        
+        # Single grouped scan feeding the yearly/quarterly trends and year-type pivot
+        self._period_type_counts = self.df.groupby(['year_added', 'quarter_added', 'type'], observed=True).size()
+    
+    def _top_n(self, column, n):
+        """
+        Count the n most frequent values of a categorical column.
+        
+        Counts category codes with bincount and partitions out the top n,
+        so only the selected counts are sorted. Ties are ordered by category.
+        
+        Args:
+            column (str): Categorical column name
+            n (int): Number of values to keep
+        
+        Returns:
+            pd.Series: Counts of the top n values, in descending order
+        """
+        categories = self.df[column].cat.categories
+        codes = self.df[column].cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        n = min(n, len(counts))
+        if n == 0:
+            return pd.Series([], index=categories[:0], dtype=np.int64)
+        
+        # Every category tied with the n-th largest count is a candidate
+        nth_largest = np.partition(counts, len(counts) - n)[len(counts) - n]
+        candidates = np.flatnonzero(counts >= nth_largest)
+        top_idx = candidates[np.argsort(-counts[candidates], kind='stable')][:n]
+        return pd.Series(counts[top_idx], index=categories[top_idx])
+    
+    def _counts_by_type(self, period):
+        """
+        Roll the cached period/type counts up to a single period column.
+        
+        Args:
+            period (str): 'year_added' or 'quarter_added'
+        
+        Returns:
+            pd.DataFrame: Title counts per period with 'Movie' and 'TV Show' columns
+        """
+        counts = self._period_type_counts.groupby(level=[period, 'type'], observed=True).sum().unstack(fill_value=0)
+        return counts.reindex(columns=pd.Index(['Movie', 'TV Show'], name='type'), fill_value=0)
+    
+    def _print_table(self, title, table, index=False):
+        """
+        Print a titled result table when running verbosely.
+        
+        Args:
+            title (str): Heading printed above the table
+            table (pd.DataFrame): Table to print
+            index (bool): Whether to include the index
+        """
+        if not self.verbose:
+            return
+        print(f"\n{title}")
+        print(table.to_string(index=index))
+    
+    @staticmethod
+    def _count_table(counts, label, total=None):
+        """
+        Build a count/percentage table from a value_counts Series.
+        
+        Args:
+            counts (pd.Series): Counts indexed by category
+            label (str): Name of the category column
+            total (int): Denominator for percentages (defaults to counts sum)
+        
+        Returns:
+            pd.DataFrame: Table with label, 'Count' and 'Percentage' columns
+        """
+        if total is None:
+            total = counts.sum()
+        values = counts.to_numpy()
+        return pd.DataFrame({
+            label: counts.index,
+            'Count': values,
+            'Percentage': np.round(values * (100.0 / total), 2)
+        })
     
     def generate_statistical_summary(self):
         """
@@ -41,13 +164,13 @@ class Analyzer:
         summary_stats = {}
         
         # Total counts
-        summary_stats['Total Titles'] = len(self.df)
-        summary_stats['Total Movies'] = self.df['is_movie'].sum()
-        summary_stats['Total TV Shows'] = self.df['is_tv_show'].sum()
+        summary_stats['Total Titles'] = self._total_titles
+        summary_stats['Total Movies'] = self._total_movies
+        summary_stats['Total TV Shows'] = self._flag_totals['is_tv_show']
         
         # Percentages
-        summary_stats['% Movies'] = (self.df['is_movie'].sum() / len(self.df) * 100).round(2)
-        summary_stats['% TV Shows'] = (self.df['is_tv_show'].sum() / len(self.df) * 100).round(2)
+        summary_stats['% Movies'] = (self._total_movies / self._total_titles * 100).round(2)
+        summary_stats['% TV Shows'] = (self._flag_totals['is_tv_show'] / self._total_titles * 100).round(2)
         
         # Average durations
         summary_stats['Avg Movie Duration (min)'] = self.df['duration_minutes'].mean().round(2)
@@ -59,12 +182,12 @@ class Analyzer:
         summary_stats['Oldest Content (years)'] = self.df['content_age'].max()
         
         # Rating distribution
-        summary_stats['Adult Content Count'] = self.df['is_adult_content'].sum()
-        summary_stats['% Adult Content'] = (self.df['is_adult_content'].sum() / len(self.df) * 100).round(2)
+        summary_stats['Adult Content Count'] = self._flag_totals['is_adult_content']
+        summary_stats['% Adult Content'] = (self._flag_totals['is_adult_content'] / self._total_titles * 100).round(2)
         
         # International content
-        summary_stats['Multi-Country Productions'] = self.df['is_multi_country'].sum()
-        summary_stats['% Multi-Country'] = (self.df['is_multi_country'].sum() / len(self.df) * 100).round(2)
+        summary_stats['Multi-Country Productions'] = self._flag_totals['is_multi_country']
+        summary_stats['% Multi-Country'] = (self._flag_totals['is_multi_country'] / self._total_titles * 100).round(2)
         
         # Genre statistics
         summary_stats['Avg Genres per Title'] = self.df['genre_count'].mean().round(2)
@@ -73,7 +196,8 @@ class Analyzer:
         # Convert to DataFrame for better display
         summary_df = pd.DataFrame(list(summary_stats.items()), columns=['Metric', 'Value'])
         
-        print("\n" + summary_df.to_string(index=False))
+        if self.verbose:
+            print("\n" + summary_df.to_string(index=False))
         
         self.results['statistical_summary'] = summary_df
         return summary_df
@@ -92,32 +216,22 @@ class Analyzer:
         results = {}
         
         # Content age category distribution
-        age_dist = self.df['content_age_category'].value_counts().reset_index()
-        age_dist.columns = ['Age Category', 'Count']
-        age_dist['Percentage'] = (age_dist['Count'] / age_dist['Count'].sum() * 100).round(2)
-        age_dist = age_dist.sort_values('Count', ascending=False)
+        age_dist = self._count_table(self.df['content_age_category'].value_counts(), 'Age Category')
         
         results['content_age_distribution'] = age_dist
-        print("\nContent Age Distribution:")
-        print(age_dist.to_string(index=False))
+        self._print_table("Content Age Distribution:", age_dist)
         
         # Duration categories (movies only)
-        duration_dist = self.df[self.df['is_movie'] == 1]['duration_category'].value_counts().reset_index()
-        duration_dist.columns = ['Duration Category', 'Count']
-        duration_dist['Percentage'] = (duration_dist['Count'] / duration_dist['Count'].sum() * 100).round(2)
+        duration_dist = self._count_table(self._movies_df['duration_category'].value_counts(), 'Duration Category')
         
         results['movie_duration_distribution'] = duration_dist
-        print("\nMovie Duration Distribution:")
-        print(duration_dist.to_string(index=False))
+        self._print_table("Movie Duration Distribution:", duration_dist)
         
         # Release era distribution
-        era_dist = self.df['release_era'].value_counts().reset_index()
-        era_dist.columns = ['Release Era', 'Count']
-        era_dist['Percentage'] = (era_dist['Count'] / era_dist['Count'].sum() * 100).round(2)
+        era_dist = self._count_table(self.df['release_era'].value_counts(), 'Release Era')
         
         results['release_era_distribution'] = era_dist
-        print("\nRelease Era Distribution:")
-        print(era_dist.to_string(index=False))
+        self._print_table("Release Era Distribution:", era_dist)
         
         self.results['content_type_analysis'] = results
         return results
@@ -136,31 +250,22 @@ class Analyzer:
         results = {}
         
         # Top 10 genres
-        top_genres = self.df['primary_genre'].value_counts().head(10).reset_index()
-        top_genres.columns = ['Genre', 'Count']
-        top_genres['Percentage'] = (top_genres['Count'] / len(self.df) * 100).round(2)
+        top_genres = self._count_table(self._top_genres, 'Genre', total=self._total_titles)
         
         results['top_genres'] = top_genres
-        print("\nTop 10 Genres:")
-        print(top_genres.to_string(index=False))
+        self._print_table("Top 10 Genres:", top_genres)
         
         # Top 10 countries
-        top_countries = self.df['primary_country'].value_counts().head(10).reset_index()
-        top_countries.columns = ['Country', 'Count']
-        top_countries['Percentage'] = (top_countries['Count'] / len(self.df) * 100).round(2)
+        top_countries = self._count_table(self._top_countries, 'Country', total=self._total_titles)
         
         results['top_countries'] = top_countries
-        print("\nTop 10 Countries:")
-        print(top_countries.to_string(index=False))
+        self._print_table("Top 10 Countries:", top_countries)
         
         # Genre count analysis
-        genre_count_dist = self.df['genre_count'].value_counts().sort_index().reset_index()
-        genre_count_dist.columns = ['Number of Genres', 'Count']
-        genre_count_dist['Percentage'] = (genre_count_dist['Count'] / genre_count_dist['Count'].sum() * 100).round(2)
+        genre_count_dist = self._count_table(self.df['genre_count'].value_counts().sort_index(), 'Number of Genres')
         
         results['genre_count_distribution'] = genre_count_dist
-        print("\nGenre Count Distribution:")
-        print(genre_count_dist.to_string(index=False))
+        self._print_table("Genre Count Distribution:", genre_count_dist)
         
         self.results['genre_country_analysis'] = results
         return results
@@ -179,44 +284,34 @@ class Analyzer:
         results = {}
         
         # Content added per year
-        yearly_additions = self.df.groupby('year_added').agg({
-            'show_id': 'count',
-            'is_movie': 'sum',
-            'is_tv_show': 'sum'
-        }).reset_index()
-        yearly_additions.columns = ['Year', 'Total Titles', 'Movies', 'TV Shows']
-        yearly_additions = yearly_additions.sort_values('Year')
+        year_type = self._counts_by_type('year_added')
+        yearly_additions = pd.DataFrame({
+            'Year': year_type.index,
+            'Total Titles': year_type.sum(axis=1).values,
+            'Movies': year_type['Movie'].values,
+            'TV Shows': year_type['TV Show'].values
+        })
         
         results['yearly_additions'] = yearly_additions
-        print("\nContent Added Per Year:")
-        print(yearly_additions.to_string(index=False))
+        self._print_table("Content Added Per Year:", yearly_additions)
         
-        # Content added per month (across all years)
-        monthly_additions = self.df.groupby('month_name').size().reset_index(name='Count')
-        
-        # Reorder months chronologically
-        month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                       'July', 'August', 'September', 'October', 'November', 'December']
-        monthly_additions['month_name'] = pd.Categorical(monthly_additions['month_name'], 
-                                                          categories=month_order, 
-                                                          ordered=True)
-        monthly_additions = monthly_additions.sort_values('month_name')
+        # Content added per month (across all years), already in calendar order
+        monthly_additions = self.df.groupby('month_name', observed=False).size().reset_index(name='Count')
         
         results['monthly_additions'] = monthly_additions
-        print("\nContent Added Per Month (All Years Combined):")
-        print(monthly_additions.to_string(index=False))
+        self._print_table("Content Added Per Month (All Years Combined):", monthly_additions)
         
         # Quarterly trends
-        quarterly_additions = self.df.groupby('quarter_added').agg({
-            'show_id': 'count',
-            'is_movie': 'sum',
-            'is_tv_show': 'sum'
-        }).reset_index()
-        quarterly_additions.columns = ['Quarter', 'Total Titles', 'Movies', 'TV Shows']
+        quarter_type = self._counts_by_type('quarter_added')
+        quarterly_additions = pd.DataFrame({
+            'Quarter': quarter_type.index,
+            'Total Titles': quarter_type.sum(axis=1).values,
+            'Movies': quarter_type['Movie'].values,
+            'TV Shows': quarter_type['TV Show'].values
+        })
         
         results['quarterly_additions'] = quarterly_additions
-        print("\nContent Added Per Quarter:")
-        print(quarterly_additions.to_string(index=False))
+        self._print_table("Content Added Per Quarter:", quarterly_additions)
         
         self.results['time_series_analysis'] = results
         return results
@@ -235,37 +330,33 @@ class Analyzer:
         results = {}
         
         # Average duration by genre (top 10 genres, movies only)
-        top_10_genres = self.df['primary_genre'].value_counts().head(10).index.tolist()
-        movie_genre_duration = self.df[
-            (self.df['is_movie'] == 1) & 
-            (self.df['primary_genre'].isin(top_10_genres))
-        ].groupby('primary_genre')['duration_minutes'].agg(['mean', 'median', 'min', 'max', 'count']).reset_index()
+        top_10_genres = self._top_genres.index.tolist()
+        movie_genre_duration = self._movies_df[
+            self._movies_df['primary_genre'].isin(top_10_genres)
+        ].groupby('primary_genre', observed=True)['duration_minutes'].agg(['mean', 'median', 'min', 'max', 'count']).reset_index()
         
         movie_genre_duration.columns = ['Genre', 'Avg Duration', 'Median Duration', 'Min', 'Max', 'Count']
         movie_genre_duration = movie_genre_duration.round(2)
         movie_genre_duration = movie_genre_duration.sort_values('Avg Duration', ascending=False)
         
         results['genre_duration_analysis'] = movie_genre_duration
-        print("\nAverage Movie Duration by Genre (Top 10 Genres):")
-        print(movie_genre_duration.to_string(index=False))
+        self._print_table("Average Movie Duration by Genre (Top 10 Genres):", movie_genre_duration)
         
         # Content by country and type (top 10 countries)
-        top_10_countries = self.df['primary_country'].value_counts().head(10).index.tolist()
+        top_10_countries = self._top_countries.index.tolist()
         country_type = self.df[self.df['primary_country'].isin(top_10_countries)].groupby(
-            ['primary_country', 'type']
+            ['primary_country', 'type'], observed=True
         ).size().reset_index(name='Count')
         
         results['country_type_breakdown'] = country_type
-        print("\nContent Breakdown by Country and Type (Top 10 Countries):")
-        print(country_type.to_string(index=False))
+        self._print_table("Content Breakdown by Country and Type (Top 10 Countries):", country_type)
         
         # Rating distribution by content type
-        rating_type = self.df.groupby(['rating', 'type']).size().reset_index(name='Count')
+        rating_type = self.df.groupby(['rating', 'type'], observed=True).size().reset_index(name='Count')
         rating_type = rating_type.sort_values('Count', ascending=False)
         
         results['rating_type_distribution'] = rating_type
-        print("\nRating Distribution by Content Type:")
-        print(rating_type.head(15).to_string(index=False))
+        self._print_table("Rating Distribution by Content Type:", rating_type.head(15))
         
         self.results['advanced_groupby'] = results
         return results
@@ -284,52 +375,24 @@ class Analyzer:
         results = {}
         
         # Content type by release era
-        type_era_pivot = pd.pivot_table(
-            self.df,
-            values='show_id',
-            index='release_era',
-            columns='type',
-            aggfunc='count',
-            fill_value=0
-        )
+        type_era_pivot = self.df.groupby(['release_era', 'type'], observed=True).size().unstack(fill_value=0)
         
         results['type_by_era'] = type_era_pivot
-        print("\nContent Type by Release Era:")
-        print(type_era_pivot)
+        self._print_table("Content Type by Release Era:", type_era_pivot, index=True)
         
         # Content additions by year and type (last 10 years)
-        recent_years = sorted(self.df['year_added'].dropna().unique())[-10:]
-        recent_df = self.df[self.df['year_added'].isin(recent_years)]
-        
-        year_type_pivot = pd.pivot_table(
-            recent_df,
-            values='show_id',
-            index='year_added',
-            columns='type',
-            aggfunc='count',
-            fill_value=0
-        )
+        year_type_pivot = self._counts_by_type('year_added').tail(10)
         
         results['year_by_type'] = year_type_pivot
-        print("\nContent Additions by Year and Type (Last 10 Years):")
-        print(year_type_pivot)
+        self._print_table("Content Additions by Year and Type (Last 10 Years):", year_type_pivot, index=True)
         
         # Top genres by content type
-        top_5_genres = self.df['primary_genre'].value_counts().head(5).index.tolist()
+        top_5_genres = self._top_genres.head(5).index.tolist()
         genre_df = self.df[self.df['primary_genre'].isin(top_5_genres)]
-        
-        genre_type_pivot = pd.pivot_table(
-            genre_df,
-            values='show_id',
-            index='primary_genre',
-            columns='type',
-            aggfunc='count',
-            fill_value=0
-        )
+        genre_type_pivot = genre_df.groupby(['primary_genre', 'type'], observed=True).size().unstack(fill_value=0)
         
         results['genre_by_type'] = genre_type_pivot
-        print("\nTop Genres by Content Type:")
-        print(genre_type_pivot)
+        self._print_table("Top Genres by Content Type:", genre_type_pivot, index=True)
         
         self.results['pivot_tables'] = results
         return results
@@ -355,36 +418,49 @@ class Analyzer:
         
         return self.results
     
-    def export_results(self, output_dir="data/processed/analysis_results"):
+    def export_results(self, output_dir="data/processed/analysis_results", file_format="csv"):
         """
-        Export all analysis results to CSV files.
+        Export all analysis results to CSV or Parquet files.
         
         Args:
             output_dir (str): Directory to save results
+            file_format (str): 'csv' (default) or 'parquet' (requires pyarrow)
+        
+        Raises:
+            ValueError: If file_format is not supported
         """
+        if file_format not in ('csv', 'parquet'):
+            raise ValueError(f"Unsupported export format: {file_format}")
+        
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
         print(f"\nExporting analysis results to {output_dir}...")
         
-        files_created = []
-        
-        # Export each result
+        # Collect each result as (filename, DataFrame)
+        exports = []
         for analysis_name, result in self.results.items():
             if isinstance(result, pd.DataFrame):
                 # Single DataFrame
-                filename = f"{analysis_name}.csv"
-                filepath = output_path / filename
-                result.to_csv(filepath, index=False)
-                files_created.append(filename)
+                exports.append((f"{analysis_name}.{file_format}", result))
             elif isinstance(result, dict):
                 # Dictionary of DataFrames
                 for sub_name, sub_df in result.items():
                     if isinstance(sub_df, pd.DataFrame):
-                        filename = f"{analysis_name}_{sub_name}.csv"
-                        filepath = output_path / filename
-                        sub_df.to_csv(filepath, index=False)
-                        files_created.append(filename)
+                        exports.append((f"{analysis_name}_{sub_name}.{file_format}", sub_df))
+        
+        def write(item):
+            filename, result_df = item
+            if file_format == 'parquet':
+                result_df.to_parquet(output_path / filename, compression='snappy', index=False)
+            else:
+                result_df.to_csv(output_path / filename, index=False)
+        
+        # Writes are I/O-bound and independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(write, exports))
+        
+        files_created = [filename for filename, _ in exports]
         
         print(f"Exported {len(files_created)} analysis files:")
         for file in files_created:
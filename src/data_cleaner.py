@@ -6,6 +6,24 @@ Handles missing values, duplicates, and data type validation.
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from importlib.util import find_spec
+
+# Arrow-backed strings when pyarrow is installed, pandas' own string dtype otherwise
+TEXT_DTYPE = 'string[pyarrow]' if find_spec('pyarrow') is not None else 'string'
+
+# Placeholder values for columns where a missing value is still a usable row
+FILL_VALUES = {
+    'director': 'Unknown Director',
+    'cast': 'No Cast Information',
+    'country': 'Unknown Country',
+    'rating': 'Not Rated',
+}
+FILL_LABELS = {
+    'director': 'directors',
+    'cast': 'cast',
+    'country': 'countries',
+    'rating': 'ratings',
+}
 
 
 class DataCleaner:
@@ -13,9 +31,10 @@ class DataCleaner:
     Handles data cleaning operations for Netflix dataset.
     
     Attributes:
-        df_original (pd.DataFrame): Original dataset (unchanged)
+        original_shape (tuple): (rows, columns) of the raw dataset
         df (pd.DataFrame): Working dataset (gets cleaned)
         cleaning_report (dict): Cleaning metrics and summary
+        verbose (bool): Whether progress messages are printed
     """
     
     def __init__(self, df):
@@ -25,9 +44,20 @@ class DataCleaner:
         Args:
             df (pd.DataFrame): Raw dataset to clean
         """
-        self.df_original = df.copy()  # Keep original for comparison
-        self.df = df.copy()           # Working copy
+        self.original_shape = df.shape  # Keep original size for comparison
+        self.df = df.copy(deep=False)   # Working copy; columns are replaced, never written in place
         self.cleaning_report = {}
+        self.verbose = True
+    
+    def _print(self, *args):
+        """
+        Print a progress message when running verbosely.
+        
+        Args:
+            *args: Values passed through to print()
+        """
+        if self.verbose:
+            print(*args)
     
     def analyze_missing_values(self):
         """
@@ -36,20 +66,22 @@ class DataCleaner:
         Returns:
             pd.DataFrame: Missing value summary
         """
+        missing_counts = self.df.isnull().sum().values
         missing_data = pd.DataFrame({
             'Column': self.df.columns,
-            'Missing_Count': self.df.isnull().sum().values,
-            'Missing_Percentage': (self.df.isnull().sum().values / len(self.df) * 100).round(2)
+            'Missing_Count': missing_counts,
+            'Missing_Percentage': (missing_counts / len(self.df) * 100).round(2)
         })
         
         # Filter to only columns with missing values
         missing_data = missing_data[missing_data['Missing_Count'] > 0]
         missing_data = missing_data.sort_values('Missing_Count', ascending=False).reset_index(drop=True)
         
-        print("\n" + "="*60)
-        print("MISSING VALUE ANALYSIS")
-        print("="*60)
-        print(missing_data.to_string(index=False))
+        self._print("\n" + "="*60)
+        self._print("MISSING VALUE ANALYSIS")
+        self._print("="*60)
+        if self.verbose:
+            print(missing_data.to_string(index=False))
         
         return missing_data
     
@@ -57,49 +89,40 @@ class DataCleaner:
         """
         Handle missing values with domain-specific logic.
         """
-        print("\n" + "="*60)
-        print("HANDLING MISSING VALUES")
-        print("="*60)
+        self._print("\n" + "="*60)
+        self._print("HANDLING MISSING VALUES")
+        self._print("="*60)
         
-        initial_missing = self.df.isnull().sum().sum()
+        # Null counts are computed once up front; fills run before any rows are dropped
+        null_counts = self.df.isnull().sum()
+        initial_missing = null_counts.sum()
         
-        # 1. Director: Fill with 'Unknown Director'
-        if 'director' in self.df.columns:
-            missing_directors = self.df['director'].isnull().sum()
-            self.df['director'] = self.df['director'].fillna('Unknown Director')
-            print(f"✓ Filled {missing_directors:,} missing directors with 'Unknown Director'")
+        # 1-4. Director, cast, country and rating are filled in a single fillna call
+        fill_map = {col: value for col, value in FILL_VALUES.items() if col in self.df.columns}
+        self.df = self.df.fillna(fill_map)
+        for col in fill_map:
+            label, value = FILL_LABELS[col], fill_map[col]
+            self._print(f"✓ Filled {null_counts[col]:,} missing {label} with '{value}'")
         
-        # 2. Cast: Fill with 'No Cast Information'
-        if 'cast' in self.df.columns:
-            missing_cast = self.df['cast'].isnull().sum()
-            self.df['cast'] = self.df['cast'].fillna('No Cast Information')
-            print(f"✓ Filled {missing_cast:,} missing cast with 'No Cast Information'")
+        # Rows missing date_added or duration are combined into one mask and dropped together
+        keep = pd.Series(True, index=self.df.index)
         
-        # 3. Country: Fill with 'Unknown Country'
-        if 'country' in self.df.columns:
-            missing_country = self.df['country'].isnull().sum()
-            self.df['country'] = self.df['country'].fillna('Unknown Country')
-            print(f"✓ Filled {missing_country:,} missing countries with 'Unknown Country'")
-        
-        # 4. Date Added: Drop rows (if date is missing, data quality is questionable)
+        # 5. Date Added: Drop rows (if date is missing, data quality is questionable)
         if 'date_added' in self.df.columns:
-            rows_before = len(self.df)
-            self.df = self.df.dropna(subset=['date_added'])
-            rows_dropped = rows_before - len(self.df)
-            print(f"✓ Dropped {rows_dropped:,} rows with missing date_added")
-        
-        # 5. Rating: Fill with 'Not Rated'
-        if 'rating' in self.df.columns:
-            missing_rating = self.df['rating'].isnull().sum()
-            self.df['rating'] = self.df['rating'].fillna('Not Rated')
-            print(f"✓ Filled {missing_rating:,} missing ratings with 'Not Rated'")
+            has_date = self.df['date_added'].notna()
+            rows_dropped = (keep & ~has_date).sum()
+            keep &= has_date
+            self._print(f"✓ Dropped {rows_dropped:,} rows with missing date_added")
         
         # 6. Duration: Cannot be missing - drop these rows
         if 'duration' in self.df.columns:
-            rows_before = len(self.df)
-            self.df = self.df.dropna(subset=['duration'])
-            rows_dropped = rows_before - len(self.df)
-            print(f"✓ Dropped {rows_dropped:,} rows with missing duration")
+            has_duration = self.df['duration'].notna()
+            rows_dropped = (keep & ~has_duration).sum()
+            keep &= has_duration
+            self._print(f"✓ Dropped {rows_dropped:,} rows with missing duration")
+        
+        if not keep.all():
+            self.df = self.df.loc[keep]
         
         final_missing = self.df.isnull().sum().sum()
         self.cleaning_report['missing_values_handled'] = {
@@ -111,18 +134,28 @@ class DataCleaner:
     def remove_duplicates(self):
         """
         Remove duplicate rows from dataset.
+        
+        Titles are deduplicated on show_id when present (skipped entirely if
+        it is already unique), falling back to exact-row duplicates otherwise.
         """
-        print("\n" + "="*60)
-        print("REMOVING DUPLICATES")
-        print("="*60)
+        self._print("\n" + "="*60)
+        self._print("REMOVING DUPLICATES")
+        self._print("="*60)
         
-        initial_rows = len(self.df)
+        if 'show_id' in self.df.columns:
+            # show_id is the primary key: nothing to hash if it is already unique
+            show_ids = self.df['show_id']
+            duplicated = None if show_ids.is_unique else show_ids.duplicated(keep='first')
+        else:
+            # Remove exact duplicates
+            duplicated = self.df.duplicated(keep='first')
         
-        # Remove exact duplicates
-        self.df = self.df.drop_duplicates()
+        duplicates_removed = 0
+        if duplicated is not None:
+            duplicates_removed = duplicated.sum()
+            self.df = self.df.loc[~duplicated]
         
-        duplicates_removed = initial_rows - len(self.df)
-        print(f"✓ Removed {duplicates_removed:,} duplicate rows")
+        self._print(f"✓ Removed {duplicates_removed:,} duplicate rows")
         
         self.cleaning_report['duplicates_removed'] = duplicates_removed
     
@@ -130,44 +163,54 @@ class DataCleaner:
         """
         Validate and convert data types where necessary.
         """
-        print("\n" + "="*60)
-        print("VALIDATING DATA TYPES")
-        print("="*60)
+        self._print("\n" + "="*60)
+        self._print("VALIDATING DATA TYPES")
+        self._print("="*60)
         
         conversions = []
         
-        # 1. Convert date_added to datetime
-        if 'date_added' in self.df.columns:
+        # 1. Convert date_added to datetime (skipped if already parsed)
+        if 'date_added' in self.df.columns and not pd.api.types.is_datetime64_any_dtype(self.df['date_added']):
             try:
                 self.df['date_added'] = pd.to_datetime(self.df['date_added'], errors='coerce')
                 conversions.append("date_added → datetime")
-                print("Converted 'date_added' to datetime")
+                self._print("Converted 'date_added' to datetime")
             except Exception as e:
-                print(f"Could not convert date_added: {e}")
+                self._print(f"Could not convert date_added: {e}")
         
-        # 2. Convert release_year to integer
-        if 'release_year' in self.df.columns:
+        # 2. Convert release_year to integer (skipped if loaded as integer)
+        if 'release_year' in self.df.columns and not pd.api.types.is_integer_dtype(self.df['release_year']):
             try:
-                self.df['release_year'] = pd.to_numeric(self.df['release_year'], errors='coerce').astype('Int64')
-                conversions.append("release_year → Int64")
-                print("Converted 'release_year' to Int64")
+                self.df['release_year'] = pd.to_numeric(self.df['release_year'], errors='coerce').astype('Int16')
+                conversions.append("release_year → Int16")
+                self._print("Converted 'release_year' to Int16")
             except Exception as e:
-                print(f"Could not convert release_year: {e}")
+                self._print(f"Could not convert release_year: {e}")
         
-        # 3. Ensure categorical columns are strings
-        categorical_cols = ['type', 'title', 'director', 'cast', 'country', 'rating', 'duration', 'listed_in', 'description']
+        # 3. Low-cardinality columns become categoricals
+        categorical_cols = ['type', 'rating']
         for col in categorical_cols:
             if col in self.df.columns:
-                self.df[col] = self.df[col].astype(str)
+                self.df[col] = self.df[col].astype('category')
+                conversions.append(f"{col} → category")
+        
+        self._print(f"Converted {len(categorical_cols)} low-cardinality columns to category")
+        
+        # 4. Free-text columns become strings
+        text_cols = ['title', 'director', 'cast', 'country', 'duration', 'listed_in', 'description']
+        for col in text_cols:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype(TEXT_DTYPE)
                 conversions.append(f"{col} → string")
         
-        print(f"Ensured {len(categorical_cols)} categorical columns are strings")
+        self._print(f"Ensured {len(text_cols)} text columns are strings")
         
         self.cleaning_report['type_conversions'] = conversions
         
         # Display final data types
-        print("\nFinal Data Types:")
-        print(self.df.dtypes)
+        if self.verbose:
+            print("\nFinal Data Types:")
+            print(self.df.dtypes)
     
     def generate_cleaning_report(self):
         """
@@ -178,15 +221,16 @@ class DataCleaner:
         print("="*60)
         
         print(f"\nOriginal Dataset:")
-        print(f"   Rows: {len(self.df_original):,}")
-        print(f"   Columns: {len(self.df_original.columns)}")
+        original_rows, original_columns = self.original_shape
+        print(f"   Rows: {original_rows:,}")
+        print(f"   Columns: {original_columns}")
         
         print(f"\nCleaned Dataset:")
         print(f"   Rows: {len(self.df):,}")
         print(f"   Columns: {len(self.df.columns)}")
         
-        rows_removed = len(self.df_original) - len(self.df)
-        print(f"\nRows Removed: {rows_removed:,} ({(rows_removed/len(self.df_original)*100):.2f}%)")
+        rows_removed = original_rows - len(self.df)
+        print(f"\nRows Removed: {rows_removed:,} ({(rows_removed/original_rows*100):.2f}%)")
         
         print(f"\nMissing Values Handled:")
         if 'missing_values_handled' in self.cleaning_report:
@@ -199,37 +243,54 @@ class DataCleaner:
         
         print(f"\nType Conversions: {len(self.cleaning_report.get('type_conversions', []))}")
     
-    def clean(self):
+    def clean(self, verbose=True):
         """
         Execute full cleaning pipeline.
         
+        Args:
+            verbose (bool): Print progress and the cleaning report; when False
+                the pipeline runs silently and the report is skipped
+        
         Returns:
             pd.DataFrame: Cleaned dataset
         """
-        print("\nStarting Data Cleaning Pipeline...")
+        self.verbose = verbose
+        self._print("\nStarting Data Cleaning Pipeline...")
         
         self.analyze_missing_values()
         self.handle_missing_values()
         self.remove_duplicates()
         self.validate_data_types()
-        self.generate_cleaning_report()
+        if verbose:
+            self.generate_cleaning_report()
         
-        print("\nData cleaning complete!")
+        self._print("\nData cleaning complete!")
         
         return self.df
     
-    def export_cleaned_data(self, output_path):
+    def export_cleaned_data(self, output_path, file_format="csv"):
         """
-        Export cleaned dataset to CSV.
+        Export cleaned dataset to CSV or Parquet.
         
         Args:
             output_path (str): Path to save cleaned data
+            file_format (str): 'csv' (default) or 'parquet' (requires pyarrow)
+        
+        Raises:
+            ValueError: If file_format is not supported
         """
+        if file_format not in ('csv', 'parquet'):
+            raise ValueError(f"Unsupported export format: {file_format}")
+        
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        self.df.to_csv(output_path, index=False)
-        print(f"\nCleaned data exported to: {output_path}")
+        if file_format == 'parquet':
+            self.df.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+        else:
+            # Chunked writes bound the formatting buffer on large frames
+            self.df.to_csv(output_path, index=False, chunksize=100_000)
+        self._print(f"\nCleaned data exported to: {output_path}")
 
 
 if __name__ == "__main__":
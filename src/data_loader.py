@@ -7,6 +7,33 @@ import pandas as pd
 import os
 from pathlib import Path
 
+# Use pyarrow's multithreaded CSV parser when it is installed
+try:
+    import pyarrow
+    CSV_ENGINE = 'pyarrow'
+    PARSER_ERRORS = (pd.errors.ParserError, pyarrow.ArrowInvalid)
+except ImportError:
+    CSV_ENGINE = 'c'
+    PARSER_ERRORS = (pd.errors.ParserError,)
+
+# Fixed Netflix schema, passed up front so the parser skips type inference;
+# release_year is read loosely so one bad value is coerced to NA by the cleaner
+# instead of failing the load
+NETFLIX_DTYPES = {
+    'show_id': object,
+    'type': object,
+    'title': object,
+    'director': object,
+    'cast': object,
+    'country': object,
+    'date_added': object,
+    'release_year': object,
+    'rating': object,
+    'duration': object,
+    'listed_in': object,
+    'description': object
+}
+
 
 class DataLoader:
     """
@@ -51,7 +78,7 @@ class DataLoader:
         
         try:
             # Load CSV
-            self.df = pd.read_csv(self.filepath)
+            self.df = pd.read_csv(self.filepath, engine=CSV_ENGINE, dtype=NETFLIX_DTYPES)
             
             # Validate dataset is not empty
             if self.df.empty:
@@ -77,7 +104,7 @@ class DataLoader:
         
         except pd.errors.EmptyDataError:
             raise ValueError(f"File is empty or invalid: {self.filepath}")
-        except pd.errors.ParserError as e:
+        except PARSER_ERRORS as e:
             raise ValueError(f"Error parsing CSV file: {e}")
         except Exception as e:
             raise Exception(f"Unexpected error loading data: {e}")
@@ -6,61 +6,75 @@ Creates derived features from cleaned data.
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from datetime import date
 import re
 
 
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
 class FeatureEngineer:
     """
     Creates new features from cleaned Netflix dataset.
     
     Attributes:
         df (pd.DataFrame): Working dataset with engineered features
+        current_year (int): Reference year for content age and recency flags
         feature_summary (dict): Summary of all created features
+        verbose (bool): Whether progress messages are printed
     """
     
-    def __init__(self, df):
+    def __init__(self, df, current_year=None):
         """
         Initialize FeatureEngineer with cleaned DataFrame.
         
         Args:
             df (pd.DataFrame): Cleaned dataset
+            current_year (int): Reference year (defaults to today's year);
+                pass a fixed value for reproducible features
         """
         self.df = df.copy()
+        self.current_year = current_year if current_year is not None else date.today().year
         self.feature_summary = {}
+        self.verbose = True
+    
+    def _print(self, *args):
+        """
+        Print a progress message when running verbosely.
+        
+        Args:
+            *args: Values passed through to print()
+        """
+        if self.verbose:
+            print(*args)
     
     def extract_duration_features(self):
         """
         Extract numeric duration features from duration column.
         """
-        print("\n" + "="*60)
-        print("EXTRACTING DURATION FEATURES")
-        print("="*60)
+        self._print("\n" + "="*60)
+        self._print("EXTRACTING DURATION FEATURES")
+        self._print("="*60)
         
-        # Initialize new columns with NaN
-        self.df['duration_minutes'] = np.nan
-        self.df['duration_seasons'] = np.nan
+        # Parse the leading number once for all rows
+        duration_values = pd.to_numeric(
+            self.df['duration'].str.extract(r'(\d+)', expand=False),
+            errors='coerce'
+        ).astype(float)
         
-        # Extract minutes for movies
+        # Minutes for movies, seasons for TV shows
         movie_mask = self.df['type'] == 'Movie'
-        self.df.loc[movie_mask, 'duration_minutes'] = (
-            self.df.loc[movie_mask, 'duration']
-            .str.extract(r'(\d+)', expand=False)
-            .astype(float)
-        )
-        
-        # Extract seasons for TV shows
         tv_mask = self.df['type'] == 'TV Show'
-        self.df.loc[tv_mask, 'duration_seasons'] = (
-            self.df.loc[tv_mask, 'duration']
-            .str.extract(r'(\d+)', expand=False)
-            .astype(float)
-        )
+        self.df['duration_minutes'] = duration_values.where(movie_mask)
+        self.df['duration_seasons'] = duration_values.where(tv_mask)
         
         movies_processed = movie_mask.sum()
         tv_processed = tv_mask.sum()
         
-        print(f"Extracted duration for {movies_processed:,} movies")
-        print(f"Extracted duration for {tv_processed:,} TV shows")
+        self._print(f"Extracted duration for {movies_processed:,} movies")
+        self._print(f"Extracted duration for {tv_processed:,} TV shows")
         
         self.feature_summary['duration_features'] = {
             'duration_minutes': 'Numeric duration for movies',
@@ -71,27 +85,32 @@ class FeatureEngineer:
         """
         Create time-based features from date_added column.
         """
-        print("\n" + "="*60)
-        print("CREATING TEMPORAL FEATURES")
-        print("="*60)
+        self._print("\n" + "="*60)
+        self._print("CREATING TEMPORAL FEATURES")
+        self._print("="*60)
         
         # Ensure date_added is datetime
         if not pd.api.types.is_datetime64_any_dtype(self.df['date_added']):
             self.df['date_added'] = pd.to_datetime(self.df['date_added'], errors='coerce')
         
-        # Extract year, month, quarter
-        self.df['year_added'] = self.df['date_added'].dt.year
-        self.df['month_added'] = self.df['date_added'].dt.month
-        self.df['month_name'] = self.df['date_added'].dt.month_name()
-        self.df['quarter_added'] = self.df['date_added'].dt.quarter
-        self.df['day_of_week'] = self.df['date_added'].dt.day_name()
+        # Extract year, month, quarter from one DatetimeIndex over the column
+        dates = pd.DatetimeIndex(self.df['date_added'])
+        missing = dates.isna()
+        self.df['year_added'] = dates.year
+        self.df['month_added'] = dates.month
         
-        # Content age (current year - release year)
-        current_year = pd.Timestamp.now().year
-        self.df['content_age'] = current_year - self.df['release_year']
+        # Names come from lookup tables via integer codes (-1 for missing dates)
+        month_codes = np.where(missing, -1, dates.month - 1).astype(np.int8)
+        self.df['month_name'] = pd.Categorical.from_codes(month_codes, categories=MONTH_NAMES, ordered=True)
+        self.df['quarter_added'] = dates.quarter
+        day_codes = np.where(missing, -1, dates.dayofweek).astype(np.int8)
+        self.df['day_of_week'] = pd.Categorical.from_codes(day_codes, categories=DAY_NAMES)
         
-        print(f"Created temporal features: year, month, quarter, day_of_week")
-        print(f"Calculated content age (current year: {current_year})")
+        # Content age (current year - release year); years fit comfortably in Int16
+        self.df['content_age'] = (self.current_year - self.df['release_year']).astype('Int16')
+        
+        self._print(f"Created temporal features: year, month, quarter, day_of_week")
+        self._print(f"Calculated content age (current year: {self.current_year})")
         
         self.feature_summary['temporal_features'] = {
             'year_added': 'Year content was added to Netflix',
@@ -106,37 +125,40 @@ class FeatureEngineer:
         """
         Create binary flag features for key content attributes.
         """
-        print("\n" + "="*60)
-        print("CREATING BINARY FLAGS")
-        print("="*60)
+        self._print("\n" + "="*60)
+        self._print("CREATING BINARY FLAGS")
+        self._print("="*60)
         
         # Content type flags
-        self.df['is_movie'] = (self.df['type'] == 'Movie').astype(int)
-        self.df['is_tv_show'] = (self.df['type'] == 'TV Show').astype(int)
-        
-        # Long content flag (movies >120 min, TV shows >3 seasons)
+        is_movie = (self.df['type'] == 'Movie').to_numpy()
+        is_tv_show = (self.df['type'] == 'TV Show').to_numpy()
+        self.df['is_movie'] = is_movie.astype(np.int8)
+        self.df['is_tv_show'] = is_tv_show.astype(np.int8)
+        
+        # Long content flag (movies >120 min, TV shows >3 seasons), on raw arrays
+        duration_minutes = self.df['duration_minutes'].to_numpy()
+        duration_seasons = self.df['duration_seasons'].to_numpy()
         self.df['is_long_content'] = (
-            ((self.df['is_movie'] == 1) & (self.df['duration_minutes'] > 120)) |
-            ((self.df['is_tv_show'] == 1) & (self.df['duration_seasons'] > 3))
-        ).astype(int)
+            (is_movie & (duration_minutes > 120)) |
+            (is_tv_show & (duration_seasons > 3))
+        ).astype(np.int8)
         
         # Recent content flag (added in last 3 years)
-        current_year = pd.Timestamp.now().year
         self.df['is_recent_addition'] = (
-            self.df['year_added'] >= (current_year - 3)
-        ).astype(int)
+            self.df['year_added'] >= (self.current_year - 3)
+        ).astype(np.int8)
         
         # Adult content flag
         adult_ratings = ['TV-MA', 'R', 'NC-17']
         self.df['is_adult_content'] = (
             self.df['rating'].isin(adult_ratings)
-        ).astype(int)
+        ).astype(np.int8)
         
-        print(f"Created binary flags:")
-        print(f"   - Content type: is_movie, is_tv_show")
-        print(f"   - Long content: is_long_content")
-        print(f"   - Recent additions: is_recent_addition")
-        print(f"   - Adult content: is_adult_content")
+        self._print(f"Created binary flags:")
+        self._print(f"   - Content type: is_movie, is_tv_show")
+        self._print(f"   - Long content: is_long_content")
+        self._print(f"   - Recent additions: is_recent_addition")
+        self._print(f"   - Adult content: is_adult_content")
         
         self.feature_summary['binary_flags'] = {
             'is_movie': 'Binary flag for movies (1=Movie, 0=TV Show)',
@@ -146,43 +168,66 @@ class FeatureEngineer:
             'is_adult_content': 'Rated TV-MA, R, or NC-17'
         }
     
+    @staticmethod
+    def _bin_values(values, bins, labels):
+        """
+        Bin numeric values into labelled categories.
+        
+        Equivalent to pd.cut(values, bins, labels=labels, include_lowest=True),
+        but bins with np.digitize on the raw array and builds the categorical
+        straight from the bin codes, without an IntervalIndex.
+        
+        Args:
+            values (pd.Series): Numeric values (may contain missing values)
+            bins (list): Monotonically increasing bin edges
+            labels (list): One label per bin
+        
+        Returns:
+            pd.Categorical: Ordered categories; missing or out-of-range values are NaN
+        """
+        array = values.to_numpy(dtype=float, na_value=np.nan)
+        edges = np.asarray(bins, dtype=float)
+        
+        # Right-closed bins, with the lowest edge included in the first bin
+        codes = np.digitize(array, edges, right=True) - 1
+        codes[array == edges[0]] = 0
+        codes[np.isnan(array) | (array < edges[0]) | (array > edges[-1])] = -1
+        
+        return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+    
     def create_categorical_features(self):
         """
         Create categorical groupings from numeric features.
         """
-        print("\n" + "="*60)
-        print("CREATING CATEGORICAL FEATURES")
-        print("="*60)
+        self._print("\n" + "="*60)
+        self._print("CREATING CATEGORICAL FEATURES")
+        self._print("="*60)
         
         # Content age categories
-        self.df['content_age_category'] = pd.cut(
+        self.df['content_age_category'] = self._bin_values(
             self.df['content_age'],
             bins=[0, 2, 5, 100],
-            labels=['New', 'Recent', 'Catalog'],
-            include_lowest=True
+            labels=['New', 'Recent', 'Catalog']
         )
         
-        # Duration categories for movies only
-        movie_mask = self.df['is_movie'] == 1
-        self.df.loc[movie_mask, 'duration_category'] = pd.cut(
-            self.df.loc[movie_mask, 'duration_minutes'],
+        # Duration categories for movies only (duration_minutes is NaN for TV shows)
+        self.df['duration_category'] = self._bin_values(
+            self.df['duration_minutes'],
             bins=[0, 90, 120, 300],
-            labels=['Short', 'Medium', 'Long'],
-            include_lowest=True
+            labels=['Short', 'Medium', 'Long']
         )
         
         # Release era categories
-        self.df['release_era'] = pd.cut(
+        self.df['release_era'] = self._bin_values(
             self.df['release_year'],
             bins=[1900, 1980, 2000, 2010, 2030],
-            labels=['Classic', 'Retro', 'Modern', 'Contemporary'],
-            include_lowest=True
+            labels=['Classic', 'Retro', 'Modern', 'Contemporary']
         )
         
-        print(f"Created categorical features:")
-        print(f"   - Content age: New, Recent, Catalog")
-        print(f"   - Duration: Short, Medium, Long (movies only)")
-        print(f"   - Release era: Classic, Retro, Modern, Contemporary")
+        self._print(f"Created categorical features:")
+        self._print(f"   - Content age: New, Recent, Catalog")
+        self._print(f"   - Duration: Short, Medium, Long (movies only)")
+        self._print(f"   - Release era: Classic, Retro, Modern, Contemporary")
         
         self.feature_summary['categorical_features'] = {
             'content_age_category': 'New (0-2 yrs), Recent (3-5 yrs), Catalog (6+ yrs)',
@@ -194,72 +239,60 @@ class FeatureEngineer:
         """
         Extract features from multi-value fields (genres, countries).
         """
-        print("\n" + "="*60)
-        print("HANDLING MULTI-VALUE FIELDS")
-        print("="*60)
+        self._print("\n" + "="*60)
+        self._print("HANDLING MULTI-VALUE FIELDS")
+        self._print("="*60)
+        
+        # Split each multi-value field once and reuse the lists
+        genres = self.df['listed_in'].str.split(',')
+        countries = self.df['country'].str.split(',')
         
         # Extract primary genre (the onw that was listed first)
-        self.df['primary_genre'] = (
-            self.df['listed_in']
-            .str.split(',')
-            .str[0]
-            .str.strip()
-        )
+        self.df['primary_genre'] = genres.str[0].str.strip()
         
         # Count number of genres
-        self.df['genre_count'] = (
-            self.df['listed_in']
-            .str.split(',')
-            .str.len()
-        )
+        self.df['genre_count'] = genres.str.len()
         
         # Extract primary country(also one that was present first)
-        self.df['primary_country'] = (
-            self.df['country']
-            .str.split(',')
-            .str[0]
-            .str.strip()
-        )
+        self.df['primary_country'] = countries.str[0].str.strip()
         
         # Count number of countries (indicates international co-production)
-        self.df['country_count'] = (
-            self.df['country']
-            .str.split(',')
-            .str.len()
-        )
+        self.df['country_count'] = countries.str.len()
         
         # Multi-country production flag
         self.df['is_multi_country'] = (
             self.df['country_count'] > 1
-        ).astype(int)
+        ).astype(np.int8)
         
-        # Check for specific popular genres (binary flags)
+        # Check for specific popular genres (binary flags); lowercasing once
+        # lets each check use a plain substring search instead of a regex
+        listed_in_lower = self.df['listed_in'].str.lower()
         self.df['is_drama'] = (
-            self.df['listed_in'].str.contains('Drama', case=False, na=False)
-        ).astype(int)
+            listed_in_lower.str.contains('drama', regex=False, na=False)
+        ).astype(np.int8)
         
         self.df['is_comedy'] = (
-            self.df['listed_in'].str.contains('Comed', case=False, na=False)
-        ).astype(int)
+            listed_in_lower.str.contains('comed', regex=False, na=False)
+        ).astype(np.int8)
         
         self.df['is_documentary'] = (
-            self.df['listed_in'].str.contains('Documentar', case=False, na=False)
-        ).astype(int)
+            listed_in_lower.str.contains('documentar', regex=False, na=False)
+        ).astype(np.int8)
         
         self.df['is_international'] = (
-            self.df['listed_in'].str.contains('International', case=False, na=False)
-        ).astype(int)
+            listed_in_lower.str.contains('international', regex=False, na=False)
+        ).astype(np.int8)
         
         # Check for US content
         self.df['is_us_content'] = (
-            self.df['country'].str.contains('United States', case=False, na=False)
-        ).astype(int)
+            self.df['country'].str.lower().str.contains('united states', regex=False, na=False)
+        ).astype(np.int8)
         
-        print(f"Extracted multi-value features:")
-        print(f"   - Primary genre and country")
-        print(f"   - Genre count and country count")
-        print(f"   - Genre flags: drama, comedy, documentary, international")
-        print(f"   - Country flags: US content, multi-country")
+        self._print(f"Extracted multi-value features:")
+        self._print(f"   - Primary genre and country")
+        self._print(f"   - Genre count and country count")
+        self._print(f"   - Genre flags: drama, comedy, documentary, international")
+        self._print(f"   - Country flags: US content, multi-country")
         
         self.feature_summary['multi_value_features'] = {
             'primary_genre': 'First listed genre',
@@ -274,14 +307,19 @@ class FeatureEngineer:
             'is_us_content': 'Produced in/with United States'
         }
     
-    def engineer_features(self):
+    def engineer_features(self, verbose=True):
         """
         Execute full feature engineering pipeline.
         
+        Args:
+            verbose (bool): Print progress and the feature summary; when False
+                the pipeline runs silently and the summary is skipped
+        
         Returns:
             pd.DataFrame: Dataset with engineered features
         """
-        print("\nStarting Feature Engineering Pipeline...")
+        self.verbose = verbose
+        self._print("\nStarting Feature Engineering Pipeline...")
         
         self.extract_duration_features()
         self.create_temporal_features()
@@ -289,10 +327,11 @@ class FeatureEngineer:
         self.create_categorical_features()
         self.handle_multi_value_fields()
         
-        self.print_feature_summary()
+        if verbose:
+            self.print_feature_summary()
         
-        print("\nFeature engineering complete!")
-        print(f"   Total features created: {len(self.get_engineered_features())}")
+        self._print("\nFeature engineering complete!")
+        self._print(f"   Total features created: {len(self.get_engineered_features())}")
         
         return self.df
     
@@ -326,18 +365,29 @@ class FeatureEngineer:
             for feature, description in features.items():
                 print(f"  • {feature}: {description}")
     
-    def export_engineered_data(self, output_path):
+    def export_engineered_data(self, output_path, file_format="csv"):
         """
         Export dataset with engineered features.
         
         Args:
             output_path (str): Path to save data
+            file_format (str): 'csv' (default) or 'parquet' (requires pyarrow)
+        
+        Raises:
+            ValueError: If file_format is not supported
         """
+        if file_format not in ('csv', 'parquet'):
+            raise ValueError(f"Unsupported export format: {file_format}")
+        
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        self.df.to_csv(output_path, index=False)
-        print(f"\nEngineered data exported to: {output_path}")
+        if file_format == 'parquet':
+            self.df.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+        else:
+            # Chunked writes bound the formatting buffer on large frames
+            self.df.to_csv(output_path, index=False, chunksize=100_000)
+        self._print(f"\nEngineered data exported to: {output_path}")
 
 
 if __name__ == "__main__":
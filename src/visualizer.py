@@ -5,12 +5,29 @@ Creates professional data visualizations.
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Plots are only ever saved to disk, never shown
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
+from matplotlib.figure import Figure
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from functools import cached_property
 import warnings
 warnings.filterwarnings('ignore')
 
+from feature_engineer import MONTH_NAMES
+
+# Shared savefig options; a low zlib level makes PNG encoding much cheaper for slightly larger files
+PNG_KWARGS = dict(dpi=300, pil_kwargs={'compress_level': 1})
+
+# Low-cardinality columns the plots group and count by
+CATEGORICAL_COLUMNS = ['primary_genre', 'primary_country', 'rating', 'type', 'month_name']
+
+# Rule printed above and below each section banner
+BANNER_RULE = "=" * 60
+
 
 class Visualizer:
     """
@@ -19,18 +36,24 @@ class Visualizer:
     Attributes:
         df (pd.DataFrame): Dataset with engineered features
         output_dir (Path): Directory to save visualizations
-        figures (dict): Dictionary storing all created figures
+        figures (dict): Paths of the saved plots, keyed by plot name
     """
     
     def __init__(self, df, output_dir="visualizations"):
         """
         Initialize Visualizer with dataset.
         
+        Columns in CATEGORICAL_COLUMNS are converted to categoricals on a
+        shallow copy, so the caller's DataFrame is never mutated.
+        
         Args:
             df (pd.DataFrame): Dataset with engineered features
             output_dir (str): Directory to save plots
         """
-        self.df = df.copy()
+        self.df = df.copy(deep=False)
+        for col in CATEGORICAL_COLUMNS:
+            if col in self.df.columns and not isinstance(self.df[col].dtype, pd.CategoricalDtype):
+                self.df[col] = self.df[col].astype('category')
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.figures = {}
@@ -39,30 +62,124 @@ class Visualizer:
         sns.set_style("whitegrid")
         plt.rcParams['figure.figsize'] = (12, 6)
         plt.rcParams['font.size'] = 10
+        
+        # Per-thread figure and message buffer, so plot families can run concurrently
+        self._thread_state = threading.local()
+    
+    def _new_axes(self, figsize, ncols=1):
+        """
+        Clear this thread's figure and lay out fresh axes on it.
+        
+        Each thread draws on one Figure that is cleared and resized for every
+        plot instead of allocating a new one each time. Figures are created
+        directly rather than through pyplot, so no global state is shared.
+        
+        Args:
+            figsize (tuple): (width, height) in inches
+            ncols (int): Number of side-by-side axes
+        
+        Returns:
+            tuple: (figure, axes); axes is an array when ncols > 1
+        """
+        fig = getattr(self._thread_state, 'figure', None)
+        if fig is None:
+            fig = self._thread_state.figure = Figure()
+        fig.clf()
+        fig.set_size_inches(figsize)
+        return fig, fig.subplots(1, ncols)
+    
+    def _save(self, fig, filename, name):
+        """
+        Save a figure as PNG and record its path.
+        
+        Args:
+            fig (Figure): Figure to save
+            filename (str): File name without the .png suffix
+            name (str): Key under which the path is stored in self.figures
+        """
+        plot_path = self.output_dir / f'{filename}.png'
+        fig.savefig(plot_path, **PNG_KWARGS)
+        self.figures[name] = plot_path
+    
+    def _print(self, *args):
+        """
+        Print a progress message, or buffer it while running on a worker thread.
+        
+        Args:
+            *args: Values passed through to print()
+        """
+        messages = getattr(self._thread_state, 'messages', None)
+        if messages is None:
+            print(*args)
+        else:
+            messages.append(args)
+    
+    def _banner(self, title):
+        """
+        Print a section banner.
+        
+        Args:
+            title (str): Section title
+        """
+        self._print(f"\n{BANNER_RULE}\n{title}\n{BANNER_RULE}")
+    
+    def _run_buffered(self, create_plots):
+        """
+        Run one plot family, collecting its progress messages.
+        
+        Args:
+            create_plots (callable): Bound create_* method to run
+        
+        Returns:
+            list: Argument tuples of the buffered messages, in order
+        """
+        self._thread_state.messages = []
+        try:
+            create_plots()
+            return self._thread_state.messages
+        finally:
+            self._thread_state.messages = None
+    
+    @cached_property
+    def _genre_counts(self):
+        """pd.Series: Titles per primary genre, most common first."""
+        return self.df['primary_genre'].value_counts()
+    
+    @cached_property
+    def _country_counts(self):
+        """pd.Series: Titles per primary country, most common first."""
+        return self.df['primary_country'].value_counts()
+    
+    @cached_property
+    def _year_added_sorted(self):
+        """np.ndarray: Distinct years in which titles were added, ascending."""
+        return np.unique(self.df['year_added'].dropna().to_numpy())
     
     def create_distribution_plots(self):
         """
         Create distribution plots for key numeric features.
         """
-        print("\n" + "="*60)
-        print("CREATING DISTRIBUTION PLOTS")
-        print("="*60)
+        self._banner("CREATING DISTRIBUTION PLOTS")
         
         # 1. Movie Duration Distribution
-        fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+        fig, axes = self._new_axes((14, 5), ncols=2)
         
         # Histogram
         movie_durations = self.df[self.df['is_movie'] == 1]['duration_minutes'].dropna()
-        axes[0].hist(movie_durations, bins=30, color='steelblue', edgecolor='black', alpha=0.7)
+        durations = movie_durations.to_numpy(dtype=float)
+        duration_mean = durations.mean()
+        counts, edges = np.histogram(durations, bins=30)
+        axes[0].bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                    color='steelblue', edgecolor='black', alpha=0.7)
         axes[0].set_title('Movie Duration Distribution', fontsize=12, fontweight='bold')
         axes[0].set_xlabel('Duration (minutes)', fontsize=11)
         axes[0].set_ylabel('Number of Movies', fontsize=11)
-        axes[0].axvline(movie_durations.mean(), color='red', linestyle='--', linewidth=2, 
-                       label=f'Mean: {movie_durations.mean():.1f} min')
+        axes[0].axvline(duration_mean, color='red', linestyle='--', linewidth=2, 
+                       label=f'Mean: {duration_mean:.1f} min')
         axes[0].legend()
         
         # Box plot
-        axes[1].boxplot(movie_durations, vert=True, patch_artist=True,
+        axes[1].boxplot(durations, vert=True, patch_artist=True,
                        boxprops=dict(facecolor='lightblue', color='steelblue'),
                        medianprops=dict(color='red', linewidth=2),
                        whiskerprops=dict(color='steelblue'),
@@ -71,36 +188,33 @@ class Visualizer:
         axes[1].set_ylabel('Duration (minutes)', fontsize=11)
         axes[1].set_xticklabels(['Movies'])
         
-        plt.tight_layout()
-        fig.savefig(self.output_dir / 'movie_duration_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        self.figures['movie_duration_distribution'] = fig
-        print("Created movie duration distribution plots")
+        fig.tight_layout()
+        self._save(fig, 'movie_duration_distribution', 'movie_duration_distribution')
+        self._print("Created movie duration distribution plots")
         
         # 2. Content Age Distribution
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._new_axes((10, 6))
         
-        content_age = self.df['content_age'].dropna()
-        ax.hist(content_age, bins=40, color='coral', edgecolor='black', alpha=0.7)
+        content_age = self.df['content_age'].dropna().to_numpy(dtype=float)
+        age_mean, age_median = content_age.mean(), np.median(content_age)
+        counts, edges = np.histogram(content_age, bins=40)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+               color='coral', edgecolor='black', alpha=0.7)
         ax.set_title('Content Age Distribution', fontsize=14, fontweight='bold')
         ax.set_xlabel('Content Age (years)', fontsize=12)
         ax.set_ylabel('Number of Titles', fontsize=12)
-        ax.axvline(content_age.mean(), color='darkred', linestyle='--', linewidth=2, 
-                   label=f'Mean: {content_age.mean():.1f} years')
-        ax.axvline(content_age.median(), color='blue', linestyle='--', linewidth=2, 
-                   label=f'Median: {content_age.median():.1f} years')
+        ax.axvline(age_mean, color='darkred', linestyle='--', linewidth=2, 
+                   label=f'Mean: {age_mean:.1f} years')
+        ax.axvline(age_median, color='blue', linestyle='--', linewidth=2, 
+                   label=f'Median: {age_median:.1f} years')
         ax.legend()
         
-        plt.tight_layout()
-        fig.savefig(self.output_dir / 'content_age_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        self.figures['content_age_distribution'] = fig
-        print("Created content age distribution plot")
+        fig.tight_layout()
+        self._save(fig, 'content_age_distribution', 'content_age_distribution')
+        self._print("Created content age distribution plot")
         
         # 3. Genre Count Distribution
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._new_axes((10, 6))
         
         genre_counts = self.df['genre_count'].value_counts().sort_index()
         ax.bar(genre_counts.index, genre_counts.values, color='mediumseagreen', edgecolor='black', alpha=0.8)
@@ -109,31 +223,29 @@ class Visualizer:
         ax.set_ylabel('Number of Titles', fontsize=12)
         ax.set_xticks(range(1, genre_counts.index.max() + 1))
         
-        plt.tight_layout()
-        fig.savefig(self.output_dir / 'genre_count_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        self.figures['genre_count_distribution'] = fig
-        print("Created genre count distribution plot")
+        fig.tight_layout()
+        self._save(fig, 'genre_count_distribution', 'genre_count_distribution')
+        self._print("Created genre count distribution plot")
     
     def create_time_series_plots(self):
         """
         Create time series visualizations showing trends over time.
         """
-        print("\n" + "="*60)
-        print("CREATING TIME SERIES PLOTS")
-        print("="*60)
+        self._banner("CREATING TIME SERIES PLOTS")
         
         # 1. Content Added Per Year
-        yearly_data = self.df.groupby('year_added').agg({
-            'show_id': 'count',
-            'is_movie': 'sum',
-            'is_tv_show': 'sum'
-        }).reset_index()
-        yearly_data.columns = ['Year', 'Total', 'Movies', 'TV Shows']
-        yearly_data = yearly_data.sort_values('Year')
+        # One crosstab over year and type; movies and TV shows are mutually exclusive
+        type_counts = pd.crosstab(self.df['year_added'], self.df['type']).reindex(
+            columns=['Movie', 'TV Show'], fill_value=0
+        )
+        yearly_data = pd.DataFrame({
+            'Year': type_counts.index,
+            'Total': type_counts['Movie'].to_numpy() + type_counts['TV Show'].to_numpy(),
+            'Movies': type_counts['Movie'].to_numpy(),
+            'TV Shows': type_counts['TV Show'].to_numpy()
+        })
         
-        fig, ax = plt.subplots(figsize=(14, 6))
+        fig, ax = self._new_axes((14, 6))
         
         ax.plot(yearly_data['Year'], yearly_data['Total'], marker='o', linewidth=2.5, 
                 color='darkblue', label='Total Titles', markersize=6)
@@ -148,98 +260,89 @@ class Visualizer:
         ax.legend(fontsize=11, loc='upper left')
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        fig.savefig(self.output_dir / 'yearly_content_additions.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        self.figures['yearly_additions'] = fig
-        print("Created yearly content additions plot")
+        fig.tight_layout()
+        self._save(fig, 'yearly_content_additions', 'yearly_additions')
+        self._print("Created yearly content additions plot")
         
         # 2. Monthly Seasonality
-        month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                      'July', 'August', 'September', 'October', 'November', 'December']
-        monthly_data = self.df.groupby('month_name').size().reset_index(name='Count')
-        monthly_data['month_name'] = pd.Categorical(monthly_data['month_name'], 
-                                                     categories=month_order, ordered=True)
-        monthly_data = monthly_data.sort_values('month_name')
+        monthly_counts = self.df['month_name'].value_counts().reindex(MONTH_NAMES, fill_value=0).to_numpy()
         
-        fig, ax = plt.subplots(figsize=(14, 6))
+        fig, ax = self._new_axes((14, 6))
         
-        bars = ax.bar(monthly_data['month_name'], monthly_data['Count'], 
-                      color='teal', edgecolor='black', alpha=0.7)
+        # Highlight max and min months (positions match MONTH_NAMES); highlighted
+        # bars take the same face and edge color
+        colors = ['teal'] * len(MONTH_NAMES)
+        edge_colors = ['black'] * len(MONTH_NAMES)
+        for idx, color in ((int(np.argmax(monthly_counts)), 'darkgreen'),
+                           (int(np.argmin(monthly_counts)), 'lightcoral')):
+            colors[idx] = edge_colors[idx] = color
         
-        # Highlight max and min months
-        max_idx = monthly_data['Count'].idxmax()
-        min_idx = monthly_data['Count'].idxmin()
-        bars[max_idx].set_color('darkgreen')
-        bars[min_idx].set_color('lightcoral')
+        ax.bar(MONTH_NAMES, monthly_counts, 
+               color=colors, edgecolor=edge_colors, alpha=0.7)
         
         ax.set_title('Content Added by Month (All Years Combined)', fontsize=14, fontweight='bold')
         ax.set_xlabel('Month', fontsize=12)
         ax.set_ylabel('Number of Titles', fontsize=12)
         ax.tick_params(axis='x', rotation=45)
         
-        plt.tight_layout()
-        fig.savefig(self.output_dir / 'monthly_seasonality.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        self.figures['monthly_seasonality'] = fig
-        print("Created monthly seasonality plot")
+        fig.tight_layout()
+        self._save(fig, 'monthly_seasonality', 'monthly_seasonality')
+        self._print("Created monthly seasonality plot")
     
     def create_categorical_plots(self):
         """
         Create visualizations comparing categorical variables.
         """
-        print("\n" + "="*60)
-        print("CREATING CATEGORICAL COMPARISON PLOTS")
-        print("="*60)
+        self._banner("CREATING CATEGORICAL COMPARISON PLOTS")
         
         # 1. Top 10 Genres
-        top_genres = self.df['primary_genre'].value_counts().head(10)
+        top_genres = self._genre_counts.head(10)
         
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = self._new_axes((12, 6))
         
-        bars = ax.barh(top_genres.index, top_genres.values, color='skyblue', edgecolor='navy', alpha=0.8)
         # Color the top bar differently
-        bars[0].set_color('mediumseagreen')
+        colors = ['mediumseagreen'] + ['skyblue'] * (len(top_genres) - 1)
+        edge_colors = ['mediumseagreen'] + ['navy'] * (len(top_genres) - 1)
+        ax.barh(top_genres.index, top_genres.values, color=colors, edgecolor=edge_colors, alpha=0.8)
         
         ax.set_title('Top 10 Genres on Netflix', fontsize=14, fontweight='bold')
         ax.set_xlabel('Number of Titles', fontsize=12)
         ax.set_ylabel('Genre', fontsize=12)
         ax.invert_yaxis()
         
-        plt.tight_layout()
-        fig.savefig(self.output_dir / 'top_genres.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        self.figures['top_genres'] = fig
-        print("Created top genres plot")
+        fig.tight_layout()
+        self._save(fig, 'top_genres', 'top_genres')
+        self._print("Created top genres plot")
         
         # 2. Top 10 Countries
-        top_countries = self.df['primary_country'].value_counts().head(10)
+        top_countries = self._country_counts.head(10)
         
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = self._new_axes((12, 6))
         
-        bars = ax.barh(top_countries.index, top_countries.values, color='lightcoral', edgecolor='darkred', alpha=0.8)
-        bars[0].set_color('crimson')
+        colors = ['crimson'] + ['lightcoral'] * (len(top_countries) - 1)
+        edge_colors = ['crimson'] + ['darkred'] * (len(top_countries) - 1)
+        ax.barh(top_countries.index, top_countries.values, color=colors, edgecolor=edge_colors, alpha=0.8)
         
         ax.set_title('Top 10 Content Producing Countries', fontsize=14, fontweight='bold')
         ax.set_xlabel('Number of Titles', fontsize=12)
         ax.set_ylabel('Country', fontsize=12)
         ax.invert_yaxis()
         
-        plt.tight_layout()
-        fig.savefig(self.output_dir / 'top_countries.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        self.figures['top_countries'] = fig
-        print("Created top countries plot")
+        fig.tight_layout()
+        self._save(fig, 'top_countries', 'top_countries')
+        self._print("Created top countries plot")
         
         # 3. Content Type by Rating
-        fig, ax = plt.subplots(figsize=(14, 6))
-        
-        rating_type = self.df.groupby(['rating', 'type']).size().unstack(fill_value=0)
-        rating_type = rating_type.loc[rating_type.sum(axis=1).nlargest(10).index]
+        fig, ax = self._new_axes((14, 6))
+        
+        # Pick the top 10 ratings first, then cross-tabulate only their rows; ratings
+        # kept as categories but absent from the data have no rows and are skipped
+        rating_counts = self.df['rating'].value_counts(sort=False)
+        top_ratings = rating_counts[rating_counts > 0].nlargest(10).index
+        top_rating_rows = self.df[self.df['rating'].isin(top_ratings)]
+        rating_type = pd.crosstab(top_rating_rows['rating'], top_rating_rows['type']).reindex(
+            index=top_ratings, columns=['Movie', 'TV Show'], fill_value=0
+        )
         
         rating_type.plot(kind='bar', stacked=True, ax=ax, color=['steelblue', 'lightcoral'], 
                         edgecolor='black', alpha=0.8)
@@ -250,41 +353,28 @@ class Visualizer:
         ax.legend(title='Type', fontsize=11)
         ax.tick_params(axis='x', rotation=45)
         
-        plt.tight_layout()
-        fig.savefig(self.output_dir / 'rating_type_breakdown.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        self.figures['rating_type'] = fig
-        print("Created rating-type breakdown plot")
+        fig.tight_layout()
+        self._save(fig, 'rating_type_breakdown', 'rating_type')
+        self._print("Created rating-type breakdown plot")
     
     def create_heatmaps(self):
         """
         Create heatmap visualizations.
         """
-        print("\n" + "="*60)
-        print("CREATING HEATMAPS")
-        print("="*60)
+        self._banner("CREATING HEATMAPS")
         
         # 1. Year-Month Heatmap
         # Filter to last 10 years
-        recent_years = sorted(self.df['year_added'].dropna().unique())[-10:]
+        recent_years = self._year_added_sorted[-10:]
         recent_df = self.df[self.df['year_added'].isin(recent_years)]
         
-        # Create pivot table for heatmap
-        year_month_pivot = recent_df.pivot_table(
-            values='show_id',
-            index='month_name',
-            columns='year_added',
-            aggfunc='count',
-            fill_value=0
-        )
+        # Count titles per month and year
+        year_month_pivot = recent_df.groupby(['month_name', 'year_added'], observed=True).size().unstack(fill_value=0)
         
         # Reorder months
-        month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                      'July', 'August', 'September', 'October', 'November', 'December']
-        year_month_pivot = year_month_pivot.reindex(month_order)
+        year_month_pivot = year_month_pivot.reindex(MONTH_NAMES, fill_value=0)
         
-        fig, ax = plt.subplots(figsize=(14, 8))
+        fig, ax = self._new_axes((14, 8))
         
         sns.heatmap(year_month_pivot, annot=True, fmt='d', cmap='YlOrRd', 
                    linewidths=0.5, cbar_kws={'label': 'Number of Titles'}, ax=ax)
@@ -294,24 +384,22 @@ class Visualizer:
         ax.set_xlabel('Year', fontsize=12)
         ax.set_ylabel('Month', fontsize=12)
         
-        plt.tight_layout()
-        fig.savefig(self.output_dir / 'year_month_heatmap.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        self.figures['year_month_heatmap'] = fig
-        print("Created year-month heatmap")
+        fig.tight_layout()
+        self._save(fig, 'year_month_heatmap', 'year_month_heatmap')
+        self._print("Created year-month heatmap")
         
         # 2. Genre-Type Heatmap
-        top_10_genres = self.df['primary_genre'].value_counts().head(10).index.tolist()
-        genre_type_pivot = self.df[self.df['primary_genre'].isin(top_10_genres)].pivot_table(
-            values='show_id',
-            index='primary_genre',
-            columns='type',
-            aggfunc='count',
-            fill_value=0
+        # Filter on the integer category codes of the top 10 genres
+        genres = self.df['primary_genre'].cat
+        top_10_codes = genres.categories.get_indexer(self._genre_counts.head(10).index)
+        top_10_mask = np.isin(genres.codes.to_numpy(), top_10_codes)
+        genre_type_pivot = (
+            self.df[top_10_mask]
+            .groupby(['primary_genre', 'type'], observed=True).size()
+            .unstack(fill_value=0)
         )
         
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig, ax = self._new_axes((10, 8))
         
         sns.heatmap(genre_type_pivot, annot=True, fmt='d', cmap='Blues', 
                    linewidths=0.5, cbar_kws={'label': 'Number of Titles'}, ax=ax)
@@ -320,29 +408,34 @@ class Visualizer:
         ax.set_xlabel('Content Type', fontsize=12)
         ax.set_ylabel('Genre', fontsize=12)
         
-        plt.tight_layout()
-        fig.savefig(self.output_dir / 'genre_type_heatmap.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        self.figures['genre_type_heatmap'] = fig
-        print("Created genre-type heatmap")
+        fig.tight_layout()
+        self._save(fig, 'genre_type_heatmap', 'genre_type_heatmap')
+        self._print("Created genre-type heatmap")
     
     def create_all_visualizations(self):
         """
         Create all visualizations and save to output directory.
         
         Returns:
-            dict: Dictionary of all created figures
+            dict: Paths of all saved plots, keyed by plot name
         """
         print("\nStarting Visualization Creation...")
         
-        self.create_distribution_plots()
-        self.create_time_series_plots()
-        self.create_categorical_plots()
-        self.create_heatmaps()
+        # The plot families only read self.df and write separate files; each runs on
+        # its own thread and figure, and messages are replayed in the usual order
+        plot_families = [
+            self.create_distribution_plots,
+            self.create_time_series_plots,
+            self.create_categorical_plots,
+            self.create_heatmaps,
+        ]
+        with ThreadPoolExecutor(max_workers=len(plot_families)) as executor:
+            for messages in executor.map(self._run_buffered, plot_families):
+                for args in messages:
+                    print(*args)
         
         print("\nAll visualizations created!")
-        print(f"   Total plots created: {len([f for f in self.output_dir.iterdir() if f.suffix == '.png'])}")
+        print(f"   Total plots created: {len(self.figures)}")
         print(f"   Saved to: {self.output_dir}")
         
         return self.figures